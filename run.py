@@ -13,6 +13,18 @@ from pathlib import Path
 src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
+# Byte-compile the package once on first run so later cold starts load
+# cached .pyc files instead of compiling every module
+_compile_marker = src_path / "swimsync" / ".compiled"
+if not _compile_marker.exists():
+    import compileall
+
+    compileall.compile_dir(str(src_path / "swimsync"), quiet=1)
+    try:
+        _compile_marker.touch()
+    except OSError:
+        pass  # Read-only install; compiling each run is the old behaviour
+
 from swimsync.app import main
 
 if __name__ == "__main__":
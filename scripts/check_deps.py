@@ -3,16 +3,16 @@ Dependency Checker - Verifies all required tools are installed
 Run this before first use to ensure everything is set up correctly.
 """
 
+import asyncio
 import subprocess
 import sys
-import shutil
 
 
 def check_python():
     """Check Python version"""
     version = sys.version_info
     print(f"Python: {version.major}.{version.minor}.{version.micro}", end=" ")
-    
+
     if version.major >= 3 and version.minor >= 11:
         print("✓")
         return True
@@ -21,64 +21,60 @@ def check_python():
         return False
 
 
-def check_spotdl():
-    """Check spotDL installation"""
-    print("spotDL: ", end="")
-    
+async def check_spotdl():
+    """Check spotDL installation. Returns (ok, lines to print)."""
     try:
-        result = subprocess.run(
-            ["spotdl", "--version"],
-            capture_output=True,
-            text=True,
-            timeout=10
+        proc = await asyncio.create_subprocess_exec(
+            "spotdl", "--version",
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
         )
-        if result.returncode == 0:
-            version = result.stdout.strip() or result.stderr.strip()
-            print(f"{version} ✓")
-            return True
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=10)
+        if proc.returncode == 0:
+            version = stdout.decode().strip() or stderr.decode().strip()
+            return True, [f"spotDL: {version} ✓"]
         else:
-            print("✗ (installed but not working)")
-            return False
+            return False, ["spotDL: ✗ (installed but not working)"]
     except FileNotFoundError:
-        print("✗ (not installed)")
-        print("  → Install with: pip install spotdl")
-        return False
+        return False, [
+            "spotDL: ✗ (not installed)",
+            "  → Install with: pip install spotdl"
+        ]
     except Exception as e:
-        print(f"✗ (error: {e})")
-        return False
+        return False, [f"spotDL: ✗ (error: {e})"]
 
 
-def check_ffmpeg():
-    """Check FFmpeg installation"""
-    print("FFmpeg: ", end="")
-    
-    # First check if it's in PATH
-    if shutil.which("ffmpeg"):
-        try:
-            result = subprocess.run(
-                ["ffmpeg", "-version"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                # Extract version from first line
-                first_line = result.stdout.split("\n")[0]
-                print(f"{first_line[:50]}... ✓")
-                return True
-        except Exception:
-            pass
-    
-    print("✗ (not installed or not in PATH)")
-    print("  → Windows: choco install ffmpeg")
-    print("  → Or download from: https://ffmpeg.org/download.html")
-    return False
+async def check_ffmpeg():
+    """Check FFmpeg installation. Returns (ok, lines to print)."""
+    # Spawning raises FileNotFoundError when ffmpeg isn't on PATH, so a
+    # separate shutil.which() PATH walk beforehand is wasted stat calls
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-version",
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=10)
+        if proc.returncode == 0:
+            # Extract version from first line
+            first_line = stdout.decode().split("\n")[0]
+            return True, [f"FFmpeg: {first_line[:50]}... ✓"]
+    except FileNotFoundError:
+        pass
+    except Exception:
+        pass
+
+    return False, [
+        "FFmpeg: ✗ (not installed or not in PATH)",
+        "  → Windows: choco install ffmpeg",
+        "  → Or download from: https://ffmpeg.org/download.html"
+    ]
 
 
 def check_tkinter():
     """Check Tkinter availability"""
     print("Tkinter: ", end="")
-    
+
     try:
         import tkinter
         print(f"{tkinter.TkVersion} ✓")
@@ -89,31 +85,47 @@ def check_tkinter():
         return False
 
 
+async def _check_external_tools():
+    """Run the slow subprocess probes concurrently"""
+    return await asyncio.gather(check_spotdl(), check_ffmpeg())
+
+
 def main():
     print("=" * 50)
     print("Swim Sync - Dependency Check")
     print("=" * 50)
     print()
-    
+
     results = []
-    
+
+    # Cheap in-process checks run synchronously first
     results.append(("Python 3.11+", check_python()))
-    results.append(("spotDL", check_spotdl()))
-    results.append(("FFmpeg", check_ffmpeg()))
     results.append(("Tkinter", check_tkinter()))
-    
+
+    # spotDL and FFmpeg each wait on a child process; start both at once
+    # so the wall time is the slower of the two, not their sum
+    (spotdl_ok, spotdl_lines), (ffmpeg_ok, ffmpeg_lines) = asyncio.run(
+        _check_external_tools()
+    )
+    for line in spotdl_lines:
+        print(line)
+    for line in ffmpeg_lines:
+        print(line)
+    results.append(("spotDL", spotdl_ok))
+    results.append(("FFmpeg", ffmpeg_ok))
+
     print()
     print("-" * 50)
-    
+
     all_ok = all(r[1] for r in results)
-    
+
     if all_ok:
         print("✓ All dependencies satisfied!")
         print("  Run 'python app.py' to start Swim Sync")
     else:
         print("✗ Some dependencies are missing")
         print("  Please install the missing items listed above")
-    
+
     print()
     return 0 if all_ok else 1
 
@@ -0,0 +1,78 @@
+"""
+Import Profiler - Surfaces the slowest imports on the startup path
+Run this after changing module-level imports to see what startup pays for.
+
+Uses `python -X importtime`, which prints cumulative and self time for
+every module imported; we rank by self time and print the top offenders.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+TOP_N = 10
+
+
+def profile_imports():
+    """Import swimsync.app under -X importtime and return parsed rows"""
+    repo_root = Path(__file__).resolve().parent.parent
+
+    result = subprocess.run(
+        [
+            sys.executable, "-X", "importtime", "-c",
+            "import sys; sys.path.insert(0, 'src'); import swimsync.app",
+        ],
+        capture_output=True,
+        text=True,
+        cwd=repo_root,
+        timeout=60,
+    )
+
+    # Lines look like: "import time:      self [us] |  cumulative | name"
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0].strip())
+            cumulative_us = int(parts[1].strip())
+        except ValueError:
+            continue  # Header line
+        name = parts[2].strip()
+        rows.append((self_us, cumulative_us, name))
+
+    return rows
+
+
+def main():
+    print("=" * 60)
+    print("Swim Sync - Import Time Profile")
+    print("=" * 60)
+    print()
+
+    rows = profile_imports()
+
+    if not rows:
+        print("✗ No import timing data captured")
+        return 1
+
+    total_us = sum(r[0] for r in rows)
+    print(f"Modules imported: {len(rows)}")
+    print(f"Total import time: {total_us / 1000:.1f} ms")
+    print()
+    print(f"Top {TOP_N} by self time:")
+    print(f"  {'self (ms)':>10}  {'cumulative (ms)':>16}  module")
+    print("  " + "-" * 56)
+
+    for self_us, cumulative_us, name in sorted(rows, reverse=True)[:TOP_N]:
+        print(f"  {self_us / 1000:>10.2f}  {cumulative_us / 1000:>16.2f}  {name}")
+
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
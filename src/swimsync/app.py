@@ -1,28 +1,32 @@
 """
 Swim Sync - Spotify Playlist to MP3 Sync Manager
 Main application entry point with Tkinter GUI
+
+Tkinter and the UI widget modules are imported inside main() rather than
+at module top: importing this module stays cheap for entry points that
+never open the window, and the hundreds of tkinter submodules stay off
+the startup critical path until a window is actually created.
 """
 
-import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-import threading
-import json
+from __future__ import annotations
+
+import concurrent.futures
+import operator
 import os
 from pathlib import Path
-from datetime import datetime
 
 from swimsync.sync_engine import SyncEngine
 from swimsync.state_manager import StateManager
 from swimsync.config_manager import ConfigManager
-from swimsync.ui.loading import LoadingOverlay
-from swimsync.ui.empty_state import EmptyStatePanel
-from swimsync.ui.progress import SyncProgressPanel
-from swimsync.ui.shortcuts import KeyboardShortcuts
 
 
 class SwimSyncApp:
     """Main application window"""
-    
+
+    # Compiled lazily on first playlist load so `re` stays off the
+    # startup path; accepts both open.spotify.com URLs and spotify: URIs
+    _URL_RE = None
+
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("Swim Sync")
@@ -31,21 +35,56 @@ class SwimSyncApp:
         
         # Initialize managers
         self.config = ConfigManager()
-        self.state = StateManager(self.config.get("output_folder"))
+        self._state_folder = self.config.get("output_folder")
+        self.state = StateManager(self._state_folder)
         self.sync_engine = SyncEngine(self.config, self.state)
         
         # Track state
         self.playlist_tracks = []
         self.sync_preview = {"new": [], "existing": [], "removed": []}
         self.is_syncing = False
-        self.sync_thread = None
+        # URLs already loaded this session; loading one again means the
+        # user wants current data, so that fetch bypasses the cache
+        self._fetched_urls = set()
+
+        # One reusable worker pool for playlist loads and syncs instead
+        # of spawning a fresh thread per operation
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="swimsync"
+        )
+        self._sync_future = None
+
+        # folder -> (dir_mtime_ns, total_size_bytes) for the storage gauge
+        self._storage_cache = {}
+        # Storage limit is re-read only when settings are saved, not on
+        # every gauge refresh during sync
+        self._max_gb = self.config.get("storage_limit_gb") or 32
+
+        # "Title - Artist" -> tree item id, for O(1) progress updates
+        self._track_items = {}
+
+        # Latest pending sync progress payload; only one UI update is
+        # ever queued at a time, so bursts coalesce to the newest state
+        self._pending_progress = None
+        self._progress_scheduled = False
         
         # Setup UI
         self._setup_styles()
         self._create_widgets()
         self._setup_keyboard_shortcuts()
         self._load_last_session()
-    
+
+        # Stop background work before the window goes away; the pool's
+        # workers are non-daemon, so without this a mid-sync close keeps
+        # a headless process downloading until spotDL finishes
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        """Cancel in-flight work, then tear down the window"""
+        self.sync_engine.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
     def _setup_styles(self):
         """Configure ttk styles"""
         style = ttk.Style()
@@ -122,6 +161,12 @@ class SwimSyncApp:
         self.tree.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
+        # Row status colors; tags are treeview-global so configure once
+        self.tree.tag_configure("new", foreground="#28a745")
+        self.tree.tag_configure("suspect", foreground="#fd7e14")  # Orange warning
+        self.tree.tag_configure("existing", foreground="#6c757d")
+        self.tree.tag_configure("removed", foreground="#dc3545")
+
         # Empty state panel (shown when no playlist loaded)
         self.empty_state = EmptyStatePanel(list_frame)
         self.empty_state.place(relx=0.5, rely=0.5, anchor="center")
@@ -218,6 +263,8 @@ class SwimSyncApp:
     
     def _browse_folder(self):
         """Open folder picker dialog"""
+        from tkinter import filedialog
+
         folder = filedialog.askdirectory(
             initialdir=self.folder_var.get(),
             title="Select Output Folder"
@@ -225,42 +272,64 @@ class SwimSyncApp:
         if folder:
             self.folder_var.set(folder)
             self.config.set("output_folder", folder)
-            self.state = StateManager(folder)
-            self.sync_engine = SyncEngine(self.config, self.state)
+            self._rebuild_managers(folder)
             self._update_storage_display()
     
+    def _rebuild_managers(self, folder: str):
+        """Recreate state/sync managers, but only when the folder changed.
+
+        StateManager scans its folder on construction, so reloading the
+        same playlist into the same folder shouldn't pay that again.
+        """
+        if folder != self._state_folder:
+            self.state = StateManager(folder)
+            self.sync_engine = SyncEngine(self.config, self.state)
+            self._state_folder = folder
+
     def _load_playlist(self):
         """Fetch playlist metadata and compute sync preview"""
+        from tkinter import messagebox
+
         url = self.url_var.get().strip()
         if not url:
             messagebox.showwarning("Input Required", "Please enter a Spotify playlist URL")
             return
         
-        if "open.spotify.com/playlist" not in url:
+        if SwimSyncApp._URL_RE is None:
+            import re
+            SwimSyncApp._URL_RE = re.compile(
+                r'(open\.spotify\.com/playlist/|spotify:playlist:)'
+            )
+        if not self._URL_RE.search(url):
             messagebox.showerror("Invalid URL", "Please enter a valid Spotify playlist URL")
             return
         
-        # Save URL for next session
-        self.config.set("last_playlist_url", url)
-        
-        # Update state manager with current folder
+        # Save URL and folder for next session in one config write
         output_folder = self.folder_var.get()
-        self.config.set("output_folder", output_folder)
-        self.state = StateManager(output_folder)
-        self.sync_engine = SyncEngine(self.config, self.state)
+        with self.config.batch():
+            self.config.set("last_playlist_url", url)
+            self.config.set("output_folder", output_folder)
+        self._rebuild_managers(output_folder)
         
         # Disable controls during load
         self.load_btn.config(state="disabled")
         self.status_var.set("Loading playlist...")
         self.empty_state.place_forget()  # Hide empty state
         self.loading_overlay.show("Loading playlist")
-        self.root.update()
+        # Flush pending redraws only; a full update() pumps the whole
+        # event loop and can re-enter handlers mid-load
+        self.root.update_idletasks()
         
-        # Run in thread to keep UI responsive
+        # A repeat load of the same URL is an explicit refresh request;
+        # the first load still gets the cache's fast path
+        refresh = url in self._fetched_urls
+
+        # Run on the worker pool to keep UI responsive
         def load_thread():
             try:
                 # Fetch playlist info
-                playlist_name, tracks = self.sync_engine.fetch_playlist(url)
+                playlist_name, tracks = self.sync_engine.fetch_playlist(url, refresh=refresh)
+                self._fetched_urls.add(url)
                 
                 # Compute diff
                 preview = self.sync_engine.compute_diff(tracks)
@@ -272,7 +341,7 @@ class SwimSyncApp:
                 error_msg = str(e)
                 self.root.after(0, lambda msg=error_msg: self._on_load_error(msg))
         
-        threading.Thread(target=load_thread, daemon=True).start()
+        self._executor.submit(load_thread)
     
     def _on_playlist_loaded(self, name: str, tracks: list, preview: dict):
         """Handle successful playlist load"""
@@ -284,41 +353,35 @@ class SwimSyncApp:
         self.playlist_info_var.set(f"Playlist: {name} ({len(tracks)} tracks)")
 
         # Clear and populate tree
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        # Add tracks with status tags
-        for track in preview["new"]:
-            self.tree.insert("", "end", values=(
-                f"{track['title']} — {track['artist']}",
-                "● New"
-            ), tags=("new",))
-
-        # Show suspect/corrupt files first with warning
-        for track in preview.get("suspect", []):
-            reason = track.get("_suspect_reason", "Possibly corrupt")
-            self.tree.insert("", "end", values=(
-                f"{track['title']} — {track['artist']}",
-                f"⚠ {reason}"
-            ), tags=("suspect",))
-
-        for track in preview["existing"]:
-            self.tree.insert("", "end", values=(
-                f"{track['title']} — {track['artist']}",
-                "✓ Exists"
-            ), tags=("existing",))
-
-        for track in preview["removed"]:
-            self.tree.insert("", "end", values=(
-                f"{track['title']} — {track['artist']}",
-                "✗ Removed"
-            ), tags=("removed",))
-
-        # Apply tag colors
-        self.tree.tag_configure("new", foreground="#28a745")
-        self.tree.tag_configure("suspect", foreground="#fd7e14")  # Orange warning
-        self.tree.tag_configure("existing", foreground="#6c757d")
-        self.tree.tag_configure("removed", foreground="#dc3545")
+        self.tree.delete(*self.tree.get_children())
+        self._track_items.clear()
+
+        # Build all rows up front (new, then suspect warnings, then the
+        # rest), so the insert loop below is a single tight pass instead
+        # of four separate loops each poking Tk. Each row carries the
+        # "Title - Artist" key the sync engine reports progress under.
+        # itemgetter pulls both fields in one call per track; a None
+        # label means the suspect reason is read from the track itself.
+        get_title_artist = operator.itemgetter("title", "artist")
+        buckets = (
+            (preview["new"], "● New", "new"),
+            (preview.get("suspect", []), None, "suspect"),
+            (preview["existing"], "✓ Exists", "existing"),
+            (preview["removed"], "✗ Removed", "removed"),
+        )
+        rows = [
+            (*get_title_artist(track),
+             label if label is not None
+             else f"⚠ {track.get('_suspect_reason', 'Possibly corrupt')}",
+             tag)
+            for tracks_, label, tag in buckets
+            for track in tracks_
+        ]
+
+        insert = self.tree.insert
+        for title, artist, status, tag in rows:
+            item_id = insert("", "end", values=(f"{title} — {artist}", status), tags=(tag,))
+            self._track_items[f"{title} - {artist}"] = item_id
 
         # Update summary
         new_count = len(preview["new"])
@@ -349,6 +412,8 @@ class SwimSyncApp:
     
     def _on_load_error(self, error: str):
         """Handle playlist load failure"""
+        from tkinter import messagebox
+
         self.loading_overlay.hide()
         self.empty_state.place(relx=0.5, rely=0.5, anchor="center")  # Show empty state again
         self.load_btn.config(state="normal")
@@ -357,6 +422,8 @@ class SwimSyncApp:
     
     def _start_sync(self):
         """Begin the sync process"""
+        from tkinter import messagebox
+
         if self.is_syncing:
             return
 
@@ -385,12 +452,23 @@ class SwimSyncApp:
         self.sync_progress_panel.reset()
         self.sync_progress_panel.show()
 
-        # Progress callback
+        # Progress callback. "Downloading" events arrive in bursts (speed
+        # updates) and only the latest matters, so store the payload and
+        # schedule at most one idle callback — this keeps the Tk event
+        # queue from flooding. Terminal statuses (Downloaded/Failed/
+        # Deleted) finalize a row, so those are always delivered.
         def on_progress(current: int, total: int, track_name: str, status: str, extra: dict = None):
-            self.root.after(0, lambda c=current, t=total, n=track_name, s=status, e=extra:
-                            self._update_sync_progress(c, t, n, s, e or {}))
-
-        # Run sync in thread
+            payload = (current, total, track_name, status, extra or {})
+            if status == "Downloading":
+                self._pending_progress = payload
+                if not self._progress_scheduled:
+                    self._progress_scheduled = True
+                    self.root.after_idle(self._flush_progress)
+            else:
+                self._pending_progress = None
+                self.root.after(0, self._update_sync_progress, *payload)
+
+        # Run sync on the worker pool
         def sync_thread():
             try:
                 results = self.sync_engine.sync(
@@ -403,9 +481,16 @@ class SwimSyncApp:
                 error_msg = str(e)
                 self.root.after(0, lambda msg=error_msg: self._on_sync_error(msg))
         
-        self.sync_thread = threading.Thread(target=sync_thread, daemon=True)
-        self.sync_thread.start()
+        self._sync_future = self._executor.submit(sync_thread)
     
+    def _flush_progress(self):
+        """Apply the most recent queued sync progress update"""
+        self._progress_scheduled = False
+        pending = self._pending_progress
+        if pending is not None:
+            self._pending_progress = None
+            self._update_sync_progress(*pending)
+
     def _update_sync_progress(self, current: int, total: int, track_name: str, status: str, extra: dict):
         """Update UI with sync progress including speed and size"""
         # Build status message with speed info
@@ -417,25 +502,27 @@ class SwimSyncApp:
         self.sync_progress_panel.update_progress(current, total, track_name, status, extra)
 
         # Update tree item status if possible
-        for item in self.tree.get_children():
+        item = self._track_items.get(track_name)
+        if item is not None:
             values = self.tree.item(item, "values")
-            if track_name in values[0]:
-                if status == "Downloading":
-                    self.tree.item(item, values=(values[0], "◐ Downloading..."))
-                    # Scroll to make this item visible
-                    self.tree.see(item)
-                elif status == "Downloaded":
-                    size_mb = extra.get("file_size_mb", 0)
-                    size_str = f"✓ {size_mb:.1f} MB" if size_mb else "✓ Done"
-                    self.tree.item(item, values=(values[0], size_str), tags=("existing",))
-                elif status == "Failed":
-                    self.tree.item(item, values=(values[0], "✗ Failed"), tags=("removed",))
-                elif status == "Deleted":
-                    self.tree.delete(item)
-                break
+            if status == "Downloading":
+                self.tree.item(item, values=(values[0], "◐ Downloading..."))
+                # Scroll to make this item visible
+                self.tree.see(item)
+            elif status == "Downloaded":
+                size_mb = extra.get("file_size_mb", 0)
+                size_str = f"✓ {size_mb:.1f} MB" if size_mb else "✓ Done"
+                self.tree.item(item, values=(values[0], size_str), tags=("existing",))
+            elif status == "Failed":
+                self.tree.item(item, values=(values[0], "✗ Failed"), tags=("removed",))
+            elif status == "Deleted":
+                self.tree.delete(item)
+                del self._track_items[track_name]
     
     def _on_sync_complete(self, results: dict):
         """Handle sync completion"""
+        from tkinter import messagebox
+
         self.is_syncing = False
         self.sync_btn.config(state="disabled")
         self.load_btn.config(state="normal")
@@ -460,6 +547,8 @@ class SwimSyncApp:
     
     def _on_sync_error(self, error: str):
         """Handle sync failure"""
+        from tkinter import messagebox
+
         self.is_syncing = False
         self.sync_btn.config(state="normal")
         self.load_btn.config(state="normal")
@@ -471,25 +560,50 @@ class SwimSyncApp:
     def _cancel_sync(self):
         """Cancel ongoing sync"""
         if self.is_syncing:
+            if self._sync_future is not None:
+                # No-op once running, but stops a sync still queued
+                self._sync_future.cancel()
             self.sync_engine.cancel()
             self.status_var.set("Cancelling...")
     
+    def _folder_mp3_size(self, folder: str) -> int:
+        """Total size in bytes of MP3s in folder, cached on the directory mtime.
+
+        Adding or removing a track bumps the directory mtime, so unchanged
+        folders skip the per-file stat storm entirely.
+        """
+        try:
+            dir_mtime_ns = os.stat(folder).st_mtime_ns
+        except OSError:
+            return 0
+
+        cached = self._storage_cache.get(folder)
+        if cached is not None and cached[0] == dir_mtime_ns:
+            return cached[1]
+
+        # os.scandir reuses the stat data from the directory read, so
+        # this is one syscall per entry instead of glob's stat-per-check
+        with os.scandir(folder) as entries:
+            total_size = sum(
+                entry.stat(follow_symlinks=False).st_size
+                for entry in entries
+                if entry.name.endswith(".mp3") and entry.is_file(follow_symlinks=False)
+            )
+        self._storage_cache[folder] = (dir_mtime_ns, total_size)
+        return total_size
+
     def _update_storage_display(self):
         """Update the storage gauge"""
         folder = self.folder_var.get()
-        if os.path.exists(folder):
-            total_size = sum(
-                f.stat().st_size for f in Path(folder).glob("*.mp3") if f.is_file()
-            )
-            size_gb = total_size / (1024 ** 3)
-        else:
-            size_gb = 0
-        
-        max_gb = self.config.get("storage_limit_gb") or 32  # Default to 32GB if not set
-        percent = min(100, (size_gb / max_gb) * 100) if max_gb > 0 else 0
-        
+        total_size = self._folder_mp3_size(folder)
+
+        # Integer math on raw bytes; this runs on every progress update
+        max_gb = self._max_gb
+        max_bytes = max_gb * (1024 ** 3)
+        percent = min(100, (total_size * 100) // max_bytes) if max_bytes > 0 else 0
+
         self.storage_progress["value"] = percent
-        self.storage_label.config(text=f"{size_gb:.1f} GB / {max_gb} GB")
+        self.storage_label.config(text=f"{total_size / (1024 ** 3):.1f} GB / {max_gb} GB")
         
         # Change color if near limit
         if percent > 90:
@@ -499,79 +613,30 @@ class SwimSyncApp:
     
     def _open_settings(self):
         """Open settings dialog"""
+        # Rarely used; loaded on demand rather than at startup
+        from swimsync.ui.settings_dialog import SettingsDialog
         SettingsDialog(self.root, self.config, self._on_settings_changed)
     
     def _on_settings_changed(self):
         """Handle settings update"""
+        self.sync_engine.invalidate_config_cache()
+        self._max_gb = self.config.get("storage_limit_gb") or 32
         self._update_storage_display()
 
 
-class SettingsDialog:
-    """Settings configuration dialog"""
-    
-    def __init__(self, parent, config: ConfigManager, on_save_callback):
-        self.config = config
-        self.on_save = on_save_callback
-        
-        self.dialog = tk.Toplevel(parent)
-        self.dialog.title("Settings")
-        self.dialog.geometry("400x300")
-        self.dialog.transient(parent)
-        self.dialog.grab_set()
-        
-        self._create_widgets()
-    
-    def _create_widgets(self):
-        frame = ttk.Frame(self.dialog, padding="20")
-        frame.pack(fill="both", expand=True)
-        
-        row = 0
-        
-        # Bitrate
-        ttk.Label(frame, text="Audio Bitrate:").grid(row=row, column=0, sticky="w", pady=5)
-        self.bitrate_var = tk.StringVar(value=self.config.get("bitrate"))
-        bitrate_combo = ttk.Combobox(
-            frame, textvariable=self.bitrate_var,
-            values=["128k", "192k", "256k", "320k"], state="readonly", width=10
-        )
-        bitrate_combo.grid(row=row, column=1, sticky="w", pady=5)
-        row += 1
-        
-        # Storage limit
-        ttk.Label(frame, text="Storage Limit (GB):").grid(row=row, column=0, sticky="w", pady=5)
-        self.storage_var = tk.StringVar(value=str(self.config.get("storage_limit_gb")))
-        storage_spin = ttk.Spinbox(
-            frame, from_=1, to=128, textvariable=self.storage_var, width=10
-        )
-        storage_spin.grid(row=row, column=1, sticky="w", pady=5)
-        row += 1
-        
-        # Download timeout
-        ttk.Label(frame, text="Download Timeout (sec):").grid(row=row, column=0, sticky="w", pady=5)
-        self.timeout_var = tk.StringVar(value=str(self.config.get("download_timeout")))
-        timeout_spin = ttk.Spinbox(
-            frame, from_=30, to=600, textvariable=self.timeout_var, width=10
-        )
-        timeout_spin.grid(row=row, column=1, sticky="w", pady=5)
-        row += 1
-        
-        # Buttons
-        btn_frame = ttk.Frame(frame)
-        btn_frame.grid(row=row, column=0, columnspan=2, pady=20)
-        
-        ttk.Button(btn_frame, text="Save", command=self._save).pack(side="left", padx=5)
-        ttk.Button(btn_frame, text="Cancel", command=self.dialog.destroy).pack(side="left", padx=5)
-    
-    def _save(self):
-        self.config.set("bitrate", self.bitrate_var.get())
-        self.config.set("storage_limit_gb", int(self.storage_var.get()))
-        self.config.set("download_timeout", int(self.timeout_var.get()))
-        self.on_save()
-        self.dialog.destroy()
-
-
 def main():
     """Application entry point"""
+    # The GUI stack is only needed once a window is actually opened, so
+    # the imports live here; class methods pick them up as module globals.
+    global tk, ttk
+    global LoadingOverlay, EmptyStatePanel, SyncProgressPanel, KeyboardShortcuts
+    import tkinter as tk
+    from tkinter import ttk
+    from swimsync.ui.loading import LoadingOverlay
+    from swimsync.ui.empty_state import EmptyStatePanel
+    from swimsync.ui.progress import SyncProgressPanel
+    from swimsync.ui.shortcuts import KeyboardShortcuts
+
     root = tk.Tk()
     
     # Set icon if available
@@ -582,6 +647,10 @@ def main():
     
     app = SwimSyncApp(root)
     root.mainloop()
+    # _on_close already cancelled the engine and queued work; join the
+    # workers here so flush() can't serialize state mid-mutation
+    app._executor.shutdown(wait=True, cancel_futures=True)
+    app.state.flush()
 
 
 if __name__ == "__main__":
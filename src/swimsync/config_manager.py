@@ -2,16 +2,29 @@
 Config Manager - Handles application settings persistence
 """
 
+import atexit
 import json
 import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Dict
 
+# orjson parses and serializes several times faster than the stdlib;
+# fall back to json when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class ConfigManager:
     """Manages application configuration and settings"""
     
     CONFIG_FILENAME = "swimsync_config.json"
+
+    # How long to wait after a set() before flushing to disk
+    FLUSH_DELAY_SECONDS = 0.5
     
     # Default settings
     DEFAULTS = {
@@ -43,30 +56,73 @@ class ConfigManager:
         
         self.config_path = self.config_dir / self.CONFIG_FILENAME
         self._data = self._load()
+
+        # Debounced persistence: set() marks the config dirty and arms a
+        # short timer; rapid-fire changes (slider drags, settings dialog)
+        # collapse into one disk write instead of one per keystroke.
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self._in_batch = False
+        self._dir_ready = False
+        self._flush_timer: threading.Timer = None
+        atexit.register(self.flush)
     
     def _load(self) -> Dict:
         """Load configuration from disk"""
         if self.config_path.exists():
             try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    saved = json.load(f)
-                    # Merge with defaults to handle new settings
-                    merged = self.DEFAULTS.copy()
-                    merged.update(saved)
-                    return merged
-            except (json.JSONDecodeError, IOError):
+                raw = self.config_path.read_bytes()
+                saved = orjson.loads(raw) if orjson else json.loads(raw)
+                # Merge with defaults to handle new settings
+                merged = self.DEFAULTS.copy()
+                merged.update(saved)
+                return merged
+            except (ValueError, IOError):
                 return self.DEFAULTS.copy()
         
         return self.DEFAULTS.copy()
     
     def save(self):
-        """Save configuration to disk"""
+        """Save configuration to disk (atomic, crash-safe)"""
+        with self._save_lock:
+            self._dirty = False
+            self._write()
+
+    def _write(self):
+        """Write the config file. Caller holds _save_lock."""
         try:
-            self.config_dir.mkdir(parents=True, exist_ok=True)
+            # Ensure the directory once, not on every write; if a write
+            # fails later the flag resets and the next save retries it
+            if not self._dir_ready:
+                self.config_dir.mkdir(parents=True, exist_ok=True)
+                self._dir_ready = True
 
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self._data, f, indent=2)
+            # Write to a temp file in the same directory, fsync, then
+            # rename over the real file. A crash mid-write leaves the old
+            # config intact instead of a truncated JSON file.
+            tmp_path = self.config_path.with_suffix('.json.tmp')
+            if orjson:
+                payload = orjson.dumps(self._data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(self._data, indent=2).encode('utf-8')
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.config_path)
+
+            # Also fsync the directory so the rename itself is durable.
+            # Not supported everywhere (e.g. Windows), hence the guard.
+            try:
+                dir_fd = os.open(self.config_dir, os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+            except OSError:
+                pass
         except (IOError, OSError, PermissionError) as e:
+            self._dir_ready = False
             # Log but don't crash - config save failure is non-fatal
             import logging
             logging.warning(f"Failed to save config: {e}")
@@ -76,9 +132,48 @@ class ConfigManager:
         return self._data.get(key, default if default is not None else self.DEFAULTS.get(key))
     
     def set(self, key: str, value: Any):
-        """Set a configuration value and save"""
+        """Set a configuration value and schedule a flush"""
         self._data[key] = value
-        self.save()
+        self._mark_dirty()
+
+    @contextmanager
+    def batch(self):
+        """
+        Group several set() calls into one write.
+
+        Inside the block, set() only updates memory; the file is written
+        once on exit instead of once per key.
+        """
+        self._in_batch = True
+        try:
+            yield self
+        finally:
+            self._in_batch = False
+            self.flush()
+
+    def _mark_dirty(self):
+        """Flag unsaved changes and (re)arm the debounce timer"""
+        with self._save_lock:
+            self._dirty = True
+            if self._in_batch:
+                return
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(
+                self.FLUSH_DELAY_SECONDS, self.flush
+            )
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self):
+        """Write any pending changes to disk immediately"""
+        with self._save_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._dirty:
+                self._dirty = False
+                self._write()
     
     def get_all(self) -> Dict:
         """Get all configuration values"""
@@ -2,13 +2,31 @@
 State Manager - Tracks downloaded files and sync state
 """
 
+import hashlib
 import json
 import logging
 import os
+import sys
 import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+# Optional fast JSON backend, same pattern as config_manager
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Multiply once instead of dividing twice per conversion
+_BYTES_TO_MB = 1.0 / (1024 * 1024)
+
+# Parsed-manifest cache shared across StateManager instances:
+# manifest path -> (st_mtime_ns, parsed dict). Re-creating a manager for
+# a folder whose manifest is unchanged skips the disk read and JSON
+# parse. Instances for the same folder share the dict, which is fine —
+# the app only ever keeps the newest manager for a given folder alive.
+_MANIFEST_CACHE: Dict[str, Tuple[int, Dict]] = {}
 
 
 class StateManager:
@@ -16,23 +34,92 @@ class StateManager:
 
     MANIFEST_FILENAME = ".swimsync_manifest.json"
 
+    # Append-only sidecar: one JSON line per add/remove since the last
+    # full save, so per-track persistence is a seek-to-end write instead
+    # of rewriting the whole manifest. Replayed over the manifest at
+    # load for crash recovery; truncated by each successful save().
+    LOG_FILENAME = ".swimsync_manifest.log"
+
     def __init__(self, output_folder: str):
         self.output_folder = Path(output_folder)
+        # str form for os.path joins in hot paths, built once
+        self._folder_str = str(self.output_folder)
         self.manifest_path = self.output_folder / self.MANIFEST_FILENAME
+        self.log_path = self.output_folder / self.LOG_FILENAME
+        # Serializes save() between the Tk thread and the sync worker.
+        # Read accessors are deliberately lock-free: they only read
+        # references the GIL hands over atomically, and the UI reads
+        # between progress callbacks, never mid-mutation. A
+        # reader/writer lock would add a dependency to protect reads
+        # that were never contended.
         self._lock = threading.Lock()
+        self._dir_ready = False
+        self._dirty = False
+        self._last_saved_digest = None
         self._data = self._load()
+        # Index for O(1) track lookup; kept in sync with _data["tracks"]
+        self._index: Dict[str, Dict] = {}
+        self._rebuild_index()
+        self._replay_log()
+        # Running total, adjusted on every mutation; avoids re-summing
+        # the whole tracks list each time the storage bar refreshes
+        self._total_size_mb = sum(
+            t.get("file_size_mb", 0) for t in self._data["tracks"]
+        )
     
     def _load(self) -> Dict:
-        """Load manifest from disk or create default"""
-        if self.manifest_path.exists():
-            try:
-                with open(self.manifest_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                # Corrupted manifest, rebuild from folder scan
-                return self._rebuild_from_folder()
-        
-        return self._default_manifest()
+        """Load manifest from disk (or cache) or create default"""
+        try:
+            mtime_ns = self.manifest_path.stat().st_mtime_ns
+        except OSError:
+            return self._default_manifest()
+
+        cached = _MANIFEST_CACHE.get(str(self.manifest_path))
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        try:
+            # Read in one syscall and parse from memory; manifests are
+            # small enough that chunked reads just add overhead
+            raw = self.manifest_path.read_bytes()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
+        except (ValueError, IOError):
+            # Corrupted manifest, rebuild from folder scan
+            return self._rebuild_from_folder()
+
+        if not self._is_valid_manifest(data):
+            # Parsed but structurally wrong (hand-edited, old format)
+            return self._rebuild_from_folder()
+
+        self._intern_track_strings(data["tracks"])
+        _MANIFEST_CACHE[str(self.manifest_path)] = (mtime_ns, data)
+        return data
+
+    @staticmethod
+    def _intern_track_strings(tracks: List[Dict]):
+        """
+        Intern the heavily repeated string values so a parsed manifest
+        holds one "downloaded" / one copy per artist name instead of a
+        fresh string object per track.
+        """
+        intern = sys.intern
+        for track in tracks:
+            for field in ("status", "artist", "album", "spotify_id"):
+                value = track.get(field)
+                if type(value) is str:
+                    track[field] = intern(value)
+
+    @staticmethod
+    def _is_valid_manifest(data) -> bool:
+        """
+        Check manifest shape once at load so accessors can index
+        directly instead of re-checking with .get() on every call.
+        """
+        return (
+            isinstance(data, dict)
+            and isinstance(data.get("tracks"), list)
+            and all(isinstance(t, dict) for t in data["tracks"])
+        )
     
     def _default_manifest(self) -> Dict:
         """Create empty manifest structure"""
@@ -45,77 +132,231 @@ class StateManager:
             "tracks": []
         }
     
+    def _append_log(self, op: str, track: Dict):
+        """Append one add/remove operation to the sidecar log"""
+        record = {
+            "op": op,
+            "track": {k: v for k, v in track.items() if not k.startswith("_")},
+        }
+        # One write per record, newline included: concurrent appenders
+        # must never interleave a payload with another record's newline
+        line = json.dumps(
+            record, ensure_ascii=False, separators=(',', ':')
+        ).encode('utf-8') + b"\n"
+        try:
+            with open(self.log_path, 'ab') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+        except (IOError, OSError, PermissionError) as e:
+            logging.warning(f"Failed to append manifest log: {e}")
+
+    def _replay_log(self):
+        """
+        Re-apply logged operations that never made it into a full save
+        (e.g. the app crashed mid-sync). Replay is idempotent, so a log
+        that is already reflected in the manifest is harmless.
+        """
+        try:
+            raw = self.log_path.read_bytes()
+        except OSError:
+            return
+
+        # Hoist attribute lookups out of the per-line loop
+        tracks = self._data["tracks"]
+        index = self._index
+        track_key = self._track_key
+        loads = json.loads
+
+        for line in raw.splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = loads(line)
+            except ValueError:
+                continue  # Torn tail line from a crash mid-append
+            track = record.get("track")
+            if not isinstance(track, dict):
+                continue
+            key = track_key(track)
+            existing = index.pop(key, None)
+            if existing is not None:
+                tracks.remove(existing)
+            if record.get("op") == "add":
+                tracks.append(track)
+                index[key] = track
+            # Replayed state is ahead of the manifest file until saved
+            self._dirty = True
+
+    @staticmethod
+    def _parse_artist_title(stem: str) -> Tuple[str, str]:
+        """
+        Split an "Artist - Title" filename stem into (artist, title).
+        One partition call instead of a contains-check plus split.
+        """
+        artist, sep, title = stem.partition(" - ")
+        if sep:
+            return artist.strip(), title.strip()
+        return "Unknown", stem
+
     def _rebuild_from_folder(self) -> Dict:
         """Rebuild manifest by scanning existing MP3 files"""
         manifest = self._default_manifest()
-        
-        if not self.output_folder.exists():
+
+        # os.scandir yields names and cached stat results from the one
+        # directory read, instead of a glob plus two stat calls per file
+        try:
+            entries = os.scandir(self.output_folder)
+        except OSError:
             return manifest
-        
-        for mp3_file in self.output_folder.glob("*.mp3"):
-            # Parse filename: "Artist - Title.mp3"
-            stem = mp3_file.stem
-            if " - " in stem:
-                parts = stem.split(" - ", 1)
-                artist = parts[0].strip()
-                title = parts[1].strip()
-            else:
-                artist = "Unknown"
-                title = stem
-            
-            track = {
-                "spotify_id": "",
-                "title": title,
-                "artist": artist,
-                "album": "",
-                "filename": mp3_file.name,
-                "file_size_mb": mp3_file.stat().st_size / (1024 * 1024),
-                "downloaded_at": datetime.fromtimestamp(
-                    mp3_file.stat().st_mtime
-                ).isoformat(),
-                "status": "downloaded"
-            }
-            manifest["tracks"].append(track)
-        
+
+        # Bind the method chain once; the loop body runs per file
+        fromtimestamp = datetime.fromtimestamp
+
+        with entries:
+            for entry in entries:
+                if not entry.name.lower().endswith(".mp3") or not entry.is_file():
+                    continue
+
+                # Parse filename: "Artist - Title.mp3"
+                artist, title = self._parse_artist_title(entry.name[:-4])
+
+                stat = entry.stat()
+                track = {
+                    "spotify_id": "",
+                    "title": title,
+                    "artist": artist,
+                    "album": "",
+                    "filename": entry.name,
+                    "file_size_mb": stat.st_size / (1024 * 1024),
+                    "downloaded_at": fromtimestamp(stat.st_mtime).isoformat(),
+                    "status": "downloaded"
+                }
+                manifest["tracks"].append(track)
+
         return manifest
     
     def save(self):
         """Save manifest to disk"""
         with self._lock:
             try:
-                self.output_folder.mkdir(parents=True, exist_ok=True)
+                # Ensure the folder once per manager, not on every save
+                if not self._dir_ready:
+                    self.output_folder.mkdir(parents=True, exist_ok=True)
+                    self._dir_ready = True
+
+                # Underscore-prefixed keys (cached "_key" etc.) are
+                # in-memory only; keep them out of the file
+                data = dict(self._data)
+                data["tracks"] = [
+                    {k: v for k, v in t.items() if not k.startswith("_")}
+                    for t in self._data["tracks"]
+                ]
+
+                # Compact output: the manifest is machine-read, so the
+                # indent/whitespace only cost bytes and serialize time
+                if orjson:
+                    payload = orjson.dumps(data)
+                else:
+                    payload = json.dumps(
+                        data, ensure_ascii=False, separators=(',', ':')
+                    ).encode('utf-8')
+
+                # Identical content means the file on disk is already
+                # right; skip the write (hashing ~100KB is far cheaper
+                # than an fsync'd write plus rename)
+                digest = hashlib.blake2b(payload, digest_size=16).digest()
+                if digest == self._last_saved_digest:
+                    self._dirty = False
+                    return
+
+                # Atomic write: temp file + fsync + rename, so a crash
+                # mid-save never leaves a torn manifest that would send
+                # the next load through _rebuild_from_folder
+                tmp_path = self.manifest_path.with_suffix('.json.tmp')
+                with open(tmp_path, 'wb') as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.manifest_path)
 
-                with open(self.manifest_path, 'w', encoding='utf-8') as f:
-                    json.dump(self._data, f, indent=2, ensure_ascii=False)
+                # The full save covers everything the log recorded
+                try:
+                    self.log_path.unlink()
+                except OSError:
+                    pass
+
+                # Keep the cross-instance cache in sync with what's on disk
+                _MANIFEST_CACHE[str(self.manifest_path)] = (
+                    self.manifest_path.stat().st_mtime_ns, self._data
+                )
+
+                self._last_saved_digest = digest
+                self._dirty = False
             except (IOError, OSError, PermissionError) as e:
+                self._dir_ready = False
                 logging.warning(f"Failed to save manifest: {e}")
-    
+
+    def flush(self):
+        """Save the manifest only if there are unsaved mutations"""
+        if self._dirty:
+            self.save()
+
     def get_all_tracks(self) -> List[Dict]:
         """Get list of all tracked tracks"""
-        return self._data.get("tracks", [])
+        return self._data["tracks"]
     
+    @staticmethod
+    def _make_key(title: str, artist: str) -> str:
+        """
+        Build the normalized lookup key for a title/artist pair.
+        casefold() matches more aggressively than lower() for non-ASCII
+        names (e.g. German eszett), so "Straße" and "STRASSE" collide
+        as the same track instead of duplicating.
+        """
+        return f"{artist.casefold().strip()}::{title.casefold().strip()}"
+
+    @classmethod
+    def _track_key(cls, track: Dict) -> str:
+        """
+        Normalized key for a track dict, cached on the dict under "_key"
+        so the lowercase/strip work happens once per track, not once per
+        lookup. Underscore-prefixed keys are stripped before saving.
+        """
+        key = track.get("_key")
+        if key is None:
+            key = cls._make_key(track.get("title", ""), track.get("artist", ""))
+            track["_key"] = key
+        return key
+
+    def _rebuild_index(self):
+        """Rebuild the key -> track index from the tracks list"""
+        self._index = {self._track_key(t): t for t in self._data["tracks"]}
+
     def get_track(self, title: str, artist: str) -> Optional[Dict]:
         """Find a specific track by title and artist"""
-        key = f"{artist.lower().strip()}::{title.lower().strip()}"
-        
-        for track in self._data.get("tracks", []):
-            track_key = f"{track.get('artist', '').lower().strip()}::{track.get('title', '').lower().strip()}"
-            if track_key == key:
-                return track
-        
-        return None
+        return self._index.get(self._make_key(title, artist))
     
-    def add_track(self, track_info: Dict, filename: str, file_size_bytes: int = 0):
+    def add_track(self, track_info: Dict, filename: str,
+                  file_size_bytes: Optional[int] = None):
         """Add a track to the manifest"""
         # Check if already exists
         existing = self.get_track(track_info.get("title", ""), track_info.get("artist", ""))
-        file_size_mb = file_size_bytes / 1024 / 1024 if file_size_bytes else self._get_file_size(filename)
+        # Only hit the disk when the caller didn't measure the file;
+        # the sync engine always passes the size it just downloaded
+        if file_size_bytes is None:
+            file_size_mb = self._get_file_size(filename)
+        else:
+            file_size_mb = file_size_bytes * _BYTES_TO_MB
         if existing:
             # Update existing entry
             existing["filename"] = filename
+            self._total_size_mb += file_size_mb - existing.get("file_size_mb", 0)
             existing["file_size_mb"] = file_size_mb
             existing["downloaded_at"] = datetime.now().isoformat()
             existing["status"] = "downloaded"
+            self._dirty = True
+            self._append_log("add", existing)
         else:
             # Add new entry
             track = {
@@ -129,21 +370,26 @@ class StateManager:
                 "status": "downloaded"
             }
             self._data["tracks"].append(track)
-    
+            self._index[self._track_key(track)] = track
+            self._total_size_mb += file_size_mb
+            self._dirty = True
+            self._append_log("add", track)
+
     def remove_track(self, track_info: Dict):
         """Remove a track from the manifest"""
-        key = f"{track_info.get('artist', '').lower().strip()}::{track_info.get('title', '').lower().strip()}"
-        
-        self._data["tracks"] = [
-            t for t in self._data["tracks"]
-            if f"{t.get('artist', '').lower().strip()}::{t.get('title', '').lower().strip()}" != key
-        ]
+        track = self._index.pop(self._track_key(track_info), None)
+        if track is not None:
+            self._data["tracks"].remove(track)
+            self._total_size_mb -= track.get("file_size_mb", 0)
+            self._dirty = True
+            self._append_log("remove", track)
     
     def update_playlist_info(self, url: str, name: str):
         """Update the playlist metadata"""
         self._data["playlist_url"] = url
         self._data["playlist_name"] = name
         self._data["last_sync"] = datetime.now().isoformat()
+        self._dirty = True
     
     def get_playlist_info(self) -> Dict:
         """Get current playlist metadata"""
@@ -154,22 +400,22 @@ class StateManager:
         }
     
     def get_total_size_mb(self) -> float:
-        """Calculate total size of all tracked files"""
-        total = 0.0
-        for track in self._data.get("tracks", []):
-            total += track.get("file_size_mb", 0)
-        return total
+        """Total size of all tracked files, from the running counter"""
+        return self._total_size_mb
     
     def get_track_count(self) -> int:
         """Get number of tracked tracks"""
-        return len(self._data.get("tracks", []))
+        return len(self._data["tracks"])
     
     def _get_file_size(self, filename: str) -> float:
         """Get file size in MB"""
-        filepath = self.output_folder / filename
-        if filepath.exists():
-            return filepath.stat().st_size / (1024 * 1024)
-        return 0.0
+        # os.path.join + one os.stat, skipping Path construction and
+        # the separate exists() probe
+        try:
+            size = os.stat(os.path.join(self._folder_str, filename)).st_size
+        except OSError:
+            return 0.0
+        return size / (1024 * 1024)
     
     def sync_with_folder(self):
         """
@@ -177,49 +423,60 @@ class StateManager:
         Removes entries for files that no longer exist.
         Adds entries for files not in manifest.
         """
-        if not self.output_folder.exists():
+        try:
+            entries = os.scandir(self.output_folder)
+        except OSError:
             return
-        
-        # Get actual files
-        actual_files = {f.name.lower(): f for f in self.output_folder.glob("*.mp3")}
-        
-        # Remove manifest entries for missing files
-        self._data["tracks"] = [
-            t for t in self._data["tracks"]
-            if t.get("filename", "").lower() in actual_files
-        ]
-        
-        # Get tracked filenames
-        tracked_files = {t.get("filename", "").lower() for t in self._data["tracks"]}
-        
-        # Add entries for untracked files
-        for filename, filepath in actual_files.items():
-            if filename not in tracked_files:
-                # Parse filename to get track info
-                stem = filepath.stem
-                if " - " in stem:
-                    parts = stem.split(" - ", 1)
-                    artist = parts[0].strip()
-                    title = parts[1].strip()
-                else:
-                    artist = "Unknown"
-                    title = stem
-                
-                track = {
+
+        # Single pass over the directory: files with a manifest entry
+        # keep it, files without one get a parsed entry. Whatever is
+        # left in tracked_by_name afterwards no longer exists on disk
+        # and is dropped.
+        tracked_by_name = {
+            t.get("filename", "").lower(): t for t in self._data["tracks"]
+        }
+        synced_tracks = []
+        fromtimestamp = datetime.fromtimestamp
+        parse_artist_title = self._parse_artist_title
+
+        with entries:
+            for entry in entries:
+                name_lower = entry.name.lower()
+                if not name_lower.endswith(".mp3") or not entry.is_file():
+                    continue
+
+                track = tracked_by_name.pop(name_lower, None)
+                if track is not None:
+                    synced_tracks.append(track)
+                    continue
+
+                # Untracked file - parse filename to get track info
+                artist, title = parse_artist_title(entry.name[:-4])
+
+                stat = entry.stat()
+                synced_tracks.append({
                     "spotify_id": "",
                     "title": title,
                     "artist": artist,
                     "album": "",
-                    "filename": filepath.name,
-                    "file_size_mb": filepath.stat().st_size / (1024 * 1024),
-                    "downloaded_at": datetime.fromtimestamp(
-                        filepath.stat().st_mtime
-                    ).isoformat(),
+                    "filename": entry.name,
+                    "file_size_mb": stat.st_size / (1024 * 1024),
+                    "downloaded_at": fromtimestamp(stat.st_mtime).isoformat(),
                     "status": "downloaded"
-                }
-                self._data["tracks"].append(track)
-    
+                })
+
+        self._data["tracks"] = synced_tracks
+        self._rebuild_index()
+        # Bulk change: recompute rather than diffing, which also sheds
+        # any float drift the incremental adjustments accumulated
+        self._total_size_mb = sum(
+            t.get("file_size_mb", 0) for t in synced_tracks
+        )
+        self._dirty = True
+
     def clear(self):
         """Clear all tracked data"""
         self._data = self._default_manifest()
+        self._rebuild_index()
+        self._total_size_mb = 0.0
         self.save()
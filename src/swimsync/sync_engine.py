@@ -6,6 +6,8 @@ import subprocess
 import json
 import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Callable, Optional, Tuple, List, Dict
 import threading
@@ -14,6 +16,55 @@ import urllib.error
 import ssl
 import certifi
 
+# Optional: drive spotDL in-process instead of forking a subprocess per
+# track, reusing its Spotify/YouTube clients and connections across the
+# whole sync. Anything going wrong here just means the subprocess path
+# is used, so be liberal about what counts as "unavailable".
+try:
+    from spotdl import Spotdl
+except Exception:
+    Spotdl = None
+
+# Optional: keep-alive connection pool for playlist scraping, so repeat
+# fetches reuse the TCP+TLS session instead of handshaking every time.
+# urllib3 ships with spotDL's dependencies but stay defensive anyway.
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None
+
+_HTTP_POOL = None
+
+
+class _PlaylistNotModified(Exception):
+    """Server returned 304: the cached playlist is still current"""
+
+
+def _get_http_pool():
+    """Shared urllib3 PoolManager, or None if urllib3 is unavailable"""
+    global _HTTP_POOL
+    if _HTTP_POOL is None and urllib3 is not None:
+        _HTTP_POOL = urllib3.PoolManager(
+            num_pools=4,
+            maxsize=16,
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=certifi.where(),
+        )
+    return _HTTP_POOL
+
+# Compiled once at import; runs for every URL parse
+_PLAYLIST_ID_RE = re.compile(r'playlist/([a-zA-Z0-9]+)')
+
+# Bytes patterns for the embed-page scrape: searching the raw response
+# skips decoding several hundred KB of HTML we never look at again
+# (json.loads accepts the matched bytes directly)
+_NEXT_DATA_RE = re.compile(rb'<script[^>]*id="__NEXT_DATA__"[^>]*>([^<]+)</script>')
+_ENTITY_RE = re.compile(rb'"entity"\s*:\s*(\{[^}]+?"tracks"[^}]+\})')
+
+# Deletion table for characters invalid in Windows filenames; a single
+# str.translate pass beats running the regex engine per filename
+_FILENAME_DELETE = str.maketrans('', '', '<>:"/\\|?*')
+
 
 def find_spotdl() -> str:
     """Find spotdl executable, checking common Python Scripts locations"""
@@ -56,31 +107,127 @@ class SyncEngine:
         self.state = state_manager
         self._lock = threading.Lock()  # Thread safety for shared state
         self._cancelled = False
-        self._current_process: Optional[subprocess.Popen] = None
+        # Live spotDL subprocesses; cancel() terminates every member.
+        # A set (not a single slot) because downloads run concurrently.
+        self._processes: set = set()
         self._spotdl_path = find_spotdl()
+        # Lazily built in-process spotDL client; False means "tried and
+        # failed, don't retry every track"
+        self._spotdl_client = None
+        # Config values read per track during a sync; cached here so the
+        # hot paths don't go through config.get for every download. The
+        # settings dialog calls invalidate_config_cache() after saving.
+        self._read_config()
+
+    def _read_config(self):
+        """Snapshot the config values the per-track code paths use"""
+        self._output_folder = Path(self.config.get("output_folder"))
+        self._bitrate = self.config.get("bitrate")
+        self._download_timeout = self.config.get("download_timeout")
+        self._concurrent_downloads = int(
+            self.config.get("concurrent_downloads") or 1
+        )
+
+    def invalidate_config_cache(self):
+        """Re-read cached config values after settings change"""
+        self._read_config()
+        # The in-process client baked in the old output folder/bitrate
+        if self._spotdl_client:
+            self._spotdl_client = None
     
-    def fetch_playlist(self, url: str) -> Tuple[str, List[Dict]]:
+    # Serve cached playlists younger than this without any network I/O
+    PLAYLIST_CACHE_TTL_SECONDS = 3600
+
+    def fetch_playlist(self, url: str, refresh: bool = False) -> Tuple[str, List[Dict]]:
         """
         Fetch playlist metadata - tries web scraping first (faster, no rate limits),
         falls back to spotDL if scraping fails.
+        Results are cached on disk per playlist; within the TTL a repeat
+        fetch is a local JSON read, after it a conditional GET lets the
+        server answer 304 instead of resending the page. refresh=True
+        bypasses the cache entirely.
         Returns (playlist_name, list of track dicts)
         """
+        cache_path, cached = self._read_playlist_cache(url)
+
+        if cached is not None and not refresh:
+            age = time.time() - cached.get("fetched_at", 0)
+            if age < self.PLAYLIST_CACHE_TTL_SECONDS:
+                return cached["name"], cached["tracks"]
+
+        etag = cached.get("etag") if cached is not None and not refresh else None
+
         # Try web scraping first (no API rate limits)
         try:
-            return self._fetch_playlist_scrape(url)
+            name, tracks, new_etag = self._fetch_playlist_scrape(url, etag=etag)
+        except _PlaylistNotModified:
+            # Re-stamp the cache so the TTL fast path applies again
+            self._write_playlist_cache(
+                cache_path, cached["name"], cached["tracks"], cached.get("etag")
+            )
+            return cached["name"], cached["tracks"]
         except Exception as scrape_error:
             print(f"Scraping failed: {scrape_error}, trying spotDL...")
+            # Fall back to spotDL
+            name, tracks = self._fetch_playlist_spotdl(url)
+            new_etag = None
+
+        self._write_playlist_cache(cache_path, name, tracks, new_etag)
+        return name, tracks
+
+    def _playlist_cache_path(self, url: str) -> Optional[Path]:
+        """Cache file for this playlist, or None when caching can't apply"""
+        cache_dir = getattr(self.config, "config_dir", None)
+        if cache_dir is None:
+            return None
+        match = _PLAYLIST_ID_RE.search(url)
+        if not match:
+            return None
+        return Path(cache_dir) / "playlist_cache" / f"{match.group(1)}.json"
+
+    def _read_playlist_cache(self, url: str):
+        """Return (cache_path, cached dict or None)"""
+        path = self._playlist_cache_path(url)
+        if path is None:
+            return None, None
+        try:
+            data = json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return path, None
+        if not isinstance(data, dict) or not isinstance(data.get("tracks"), list):
+            return path, None
+        return path, data
+
+    def _write_playlist_cache(self, path: Optional[Path], name: str,
+                              tracks: List[Dict], etag: Optional[str]):
+        """Atomically persist a fetched playlist for later short-circuits"""
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            payload = json.dumps({
+                "etag": etag,
+                "name": name,
+                "tracks": tracks,
+                "fetched_at": time.time(),
+            }, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            tmp_path = path.with_suffix('.json.tmp')
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: could not cache playlist: {e}")
 
-        # Fall back to spotDL
-        return self._fetch_playlist_spotdl(url)
-
-    def _fetch_playlist_scrape(self, url: str) -> Tuple[str, List[Dict]]:
+    def _fetch_playlist_scrape(
+        self, url: str, etag: Optional[str] = None
+    ) -> Tuple[str, List[Dict], Optional[str]]:
         """
         Fetch playlist by scraping Spotify's web page directly.
         Bypasses API rate limits entirely.
+        Returns (name, tracks, etag); raises _PlaylistNotModified when
+        the server confirms the caller's etag is still current.
         """
         # Extract playlist ID from URL
-        match = re.search(r'playlist/([a-zA-Z0-9]+)', url)
+        match = _PLAYLIST_ID_RE.search(url)
         if not match:
             raise Exception("Invalid playlist URL")
 
@@ -91,27 +238,83 @@ class SyncEngine:
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
-
-        req = urllib.request.Request(embed_url, headers=headers)
-        # Use certifi's CA bundle for proper SSL verification on Windows
-        ssl_context = ssl.create_default_context(cafile=certifi.where())
-        try:
-            with urllib.request.urlopen(req, timeout=30, context=ssl_context) as response:
-                html = response.read().decode('utf-8')
-        except urllib.error.URLError as e:
-            if isinstance(e.reason, ssl.SSLError):
+        if etag:
+            # Conditional GET: a 304 means our cached copy is current
+            headers['If-None-Match'] = etag
+        response_etag = None
+
+        pool = _get_http_pool()
+        if pool is not None:
+            # Pooled path: keep-alive connection, certifi-verified TLS.
+            # Stream the body and stop as soon as the embedded JSON is
+            # complete — the page tail never needs to be pulled through
+            # the socket or the regex engine.
+            try:
+                resp = pool.request(
+                    'GET', embed_url, headers=headers, timeout=30.0,
+                    preload_content=False
+                )
+                consumed = False
+                try:
+                    if resp.status == 304:
+                        raise _PlaylistNotModified()
+                    if resp.status >= 400:
+                        # Keep urlopen's error semantics: an HTTP failure
+                        # (404, rate limit, 5xx) must not fall through to
+                        # the regexes and read as a parse error
+                        raise Exception(
+                            f"Failed to fetch playlist page: "
+                            f"HTTP {resp.status} {resp.reason}"
+                        )
+                    response_etag = resp.headers.get('ETag')
+                    buf = bytearray()
+                    for chunk in resp.stream(65536):
+                        buf.extend(chunk)
+                        if _NEXT_DATA_RE.search(buf):
+                            break
+                    else:
+                        consumed = True
+                finally:
+                    # Only a fully read response may go back to the pool;
+                    # a connection with leftover body would poison the
+                    # next request that reuses it
+                    if consumed:
+                        resp.release_conn()
+                    else:
+                        resp.close()
+                html = bytes(buf)
+            except urllib3.exceptions.SSLError:
                 raise Exception(
                     "SSL certificate verification failed. Please check your internet connection."
                 )
-            raise Exception(f"Failed to fetch playlist page: {e}")
+            except urllib3.exceptions.HTTPError as e:
+                raise Exception(f"Failed to fetch playlist page: {e}")
+        else:
+            req = urllib.request.Request(embed_url, headers=headers)
+            # Use certifi's CA bundle for proper SSL verification on Windows
+            ssl_context = ssl.create_default_context(cafile=certifi.where())
+            try:
+                with urllib.request.urlopen(req, timeout=30, context=ssl_context) as response:
+                    response_etag = response.headers.get('ETag')
+                    html = response.read()
+            except urllib.error.HTTPError as e:
+                if e.code == 304:
+                    raise _PlaylistNotModified()
+                raise Exception(f"Failed to fetch playlist page: {e}")
+            except urllib.error.URLError as e:
+                if isinstance(e.reason, ssl.SSLError):
+                    raise Exception(
+                        "SSL certificate verification failed. Please check your internet connection."
+                    )
+                raise Exception(f"Failed to fetch playlist page: {e}")
 
         # Extract JSON data from the page
         # Spotify embeds data in a <script id="__NEXT_DATA__"> tag
-        json_match = re.search(r'<script[^>]*id="__NEXT_DATA__"[^>]*>([^<]+)</script>', html)
+        json_match = _NEXT_DATA_RE.search(html)
 
         if not json_match:
             # Try alternative: look for resource data in script
-            json_match = re.search(r'"entity"\s*:\s*(\{[^}]+?"tracks"[^}]+\})', html)
+            json_match = _ENTITY_RE.search(html)
             if not json_match:
                 raise Exception("Could not parse playlist data from page")
 
@@ -146,7 +349,7 @@ class SyncEngine:
         if not tracks:
             raise Exception("No tracks found in playlist")
 
-        return playlist_name, tracks
+        return playlist_name, tracks, response_etag
 
     def _fetch_playlist_spotdl(self, url: str) -> Tuple[str, List[Dict]]:
         """
@@ -171,17 +374,7 @@ class SyncEngine:
             data = json.loads(result.stdout)
 
             playlist_name = data.get("name", "Unknown Playlist")
-            tracks = []
-
-            for track in data.get("songs", []):
-                tracks.append({
-                    "spotify_id": track.get("song_id", ""),
-                    "title": track.get("name", "Unknown"),
-                    "artist": ", ".join(track.get("artists", ["Unknown"])),
-                    "album": track.get("album_name", ""),
-                    "url": track.get("url", ""),
-                    "duration": track.get("duration", 0),
-                })
+            tracks = self._tracks_from_spotdl_songs(data.get("songs", []))
 
             return playlist_name, tracks
 
@@ -191,7 +384,60 @@ class SyncEngine:
             return self._fetch_playlist_fallback(url)
         except FileNotFoundError:
             raise Exception("spotDL not found. Please install it with: pip install spotdl")
-    
+
+    @staticmethod
+    def _tracks_from_spotdl_songs(songs: List[Dict]) -> List[Dict]:
+        """Convert spotdl save output songs to our track dicts"""
+        return [{
+            "spotify_id": song.get("song_id", ""),
+            "title": song.get("name", "Unknown"),
+            "artist": ", ".join(song.get("artists", ["Unknown"])),
+            "album": song.get("album_name", ""),
+            "url": song.get("url", ""),
+            "duration": song.get("duration", 0),
+        } for song in songs]
+
+    def fetch_playlists_batch(self, urls: List[str]) -> List[Tuple[str, List[Dict]]]:
+        """
+        Fetch metadata for several playlists with one spotdl save call,
+        paying the subprocess startup and Spotify auth once instead of
+        per playlist. Falls back to individual fetches (which also use
+        the scraper and cache) if the batch call fails.
+        Returns a list of (playlist_name, tracks) in input order.
+        """
+        if not urls:
+            return []
+        if len(urls) == 1:
+            return [self.fetch_playlist(urls[0])]
+
+        cmd = [self._spotdl_path, "save", *urls, "--save-file", "-"]
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=180 * len(urls)
+            )
+            if result.returncode != 0:
+                raise Exception(f"spotDL exited with {result.returncode}")
+
+            data = json.loads(result.stdout)
+            if isinstance(data, dict):
+                data = [data]
+
+            return [
+                (
+                    entry.get("name", "Unknown Playlist"),
+                    self._tracks_from_spotdl_songs(entry.get("songs", []))
+                )
+                for entry in data
+            ]
+        except FileNotFoundError:
+            raise Exception("spotDL not found. Please install it with: pip install spotdl")
+        except Exception as e:
+            print(f"Batch fetch failed: {e}, fetching playlists individually...")
+            return [self.fetch_playlist(url) for url in urls]
+
     def _fetch_playlist_fallback(self, url: str) -> Tuple[str, List[Dict]]:
         """
         Fallback method using spotdl url command to list tracks
@@ -256,31 +502,38 @@ class SyncEngine:
         """
         # Get current local state
         local_tracks = self.state.get_all_tracks()
-        local_by_key = {self._track_key(t): t for t in local_tracks}
+        local_by_key = {self._cached_key(t): t for t in local_tracks}
 
-        # Scan actual files in folder with sizes
-        output_folder = Path(self.config.get("output_folder"))
+        # Scan actual files in folder with sizes; scandir returns each
+        # entry's stat from the directory read instead of per-file calls
+        output_folder = self._output_folder
         existing_files = {}  # filename_stem -> file_size
-        if output_folder.exists():
-            for f in output_folder.glob("*.mp3"):
-                existing_files[f.stem.lower()] = f.stat().st_size
+        try:
+            with os.scandir(output_folder) as entries:
+                existing_files = {
+                    e.name[:-4].lower(): e.stat().st_size
+                    for e in entries
+                    if e.name.lower().endswith(".mp3") and e.is_file()
+                }
+        except OSError:
+            pass  # Missing folder: treat as empty, same as before
+
+        # Key both sides once; bucket membership is then pure dict work.
+        # Keying the playlist also dedupes repeated entries of one song.
+        playlist_map = {self._cached_key(t): t for t in playlist_tracks}
 
         new_tracks = []
         existing_tracks = []
         suspect_tracks = []  # Potentially corrupt files
-        playlist_keys = set()
-
-        for track in playlist_tracks:
-            key = self._track_key(track)
-            playlist_keys.add(key)
 
+        for key, track in playlist_map.items():
             # Check if in manifest or on disk
-            expected_filename = self._generate_filename(track).lower().replace(".mp3", "")
+            expected_filename = self._cached_fname(track).lower()[:-4]
 
             if key in local_by_key or expected_filename in existing_files:
                 # File exists - check if it's potentially corrupt
                 file_size = existing_files.get(expected_filename, 0)
-                if file_size > 0 and file_size < self.MIN_VALID_FILE_SIZE:
+                if 0 < file_size < self.MIN_VALID_FILE_SIZE:
                     track["_suspect_reason"] = f"File too small ({file_size // 1024}KB)"
                     suspect_tracks.append(track)
                 else:
@@ -288,12 +541,11 @@ class SyncEngine:
             else:
                 new_tracks.append(track)
 
-        # Find removed tracks (in local state but not in playlist)
-        removed_tracks = []
-        for track in local_tracks:
-            key = self._track_key(track)
-            if key not in playlist_keys:
-                removed_tracks.append(track)
+        # Removed = in local state but not in playlist; iterating the
+        # key dict keeps manifest order with O(1) membership tests
+        removed_tracks = [
+            local_by_key[k] for k in local_by_key if k not in playlist_map
+        ]
 
         return {
             "new": new_tracks,
@@ -327,26 +579,47 @@ class SyncEngine:
         total_bytes = 0
         sync_start_time = time.time()
 
-        output_folder = Path(self.config.get("output_folder"))
+        output_folder = self._output_folder
         output_folder.mkdir(parents=True, exist_ok=True)
 
-        # Download new tracks
-        for track in tracks_to_download:
+        # Download new tracks with a bounded worker pool; each download
+        # spends nearly all of its time waiting on spotDL's network I/O,
+        # so concurrent subprocesses cut wall time roughly linearly
+        workers = max(1, self._concurrent_downloads)
+        started = 0
+        # High-water mark for the position reported to the callback: a
+        # "Downloading" for track N+1 can land before track N's
+        # "Downloaded", and the UI progress bar must never move backwards
+        progress_seen = 0
+
+        def _progress_position(candidate: int) -> int:
+            """Advance the reported position; never returns a smaller value"""
+            nonlocal progress_seen
+            progress_seen = max(progress_seen, candidate)
+            return progress_seen
+
+        def download_one(track):
+            """Worker body: download one track, report its start"""
+            nonlocal started
             if self._cancelled:
-                break
+                return None, 0, 0.0
 
-            current += 1
-            track_name = f"{track['title']} - {track['artist']}"
-
-            # If this is a suspect/corrupt file, delete it first so spotDL will re-download
+            # If this is a suspect/corrupt file, delete it first so spotDL will re-download.
+            # StateManager isn't thread-safe, and this runs on a worker
+            # thread while the completion loop calls add_track
             if track.get("_suspect_reason"):
                 self._delete_track(track, output_folder)
-                self.state.remove_track(track)
+                with self._lock:
+                    self.state.remove_track(track)
 
+            with self._lock:
+                started += 1
+                slot = _progress_position(started)
             if progress_callback:
                 elapsed = time.time() - sync_start_time
                 speed = (total_bytes / 1024 / 1024) / elapsed if elapsed > 0 else 0
-                progress_callback(current, total, track_name, "Downloading", {
+                track_name = f"{track['title']} - {track['artist']}"
+                progress_callback(slot, total, track_name, "Downloading", {
                     "file_size_mb": 0,
                     "speed_mbps": speed,
                     "elapsed_seconds": elapsed,
@@ -355,32 +628,53 @@ class SyncEngine:
 
             track_start = time.time()
             success, file_size = self._download_track(track, output_folder)
-            track_elapsed = time.time() - track_start
-
-            if success:
-                downloaded += 1
-                total_bytes += file_size
-                self.state.add_track(track, self._generate_filename(track), file_size)
-                self.state.save()  # Save after each track for crash recovery
-                if progress_callback:
-                    elapsed = time.time() - sync_start_time
-                    speed = (total_bytes / 1024 / 1024) / elapsed if elapsed > 0 else 0
-                    progress_callback(current, total, track_name, "Downloaded", {
-                        "file_size_mb": file_size / 1024 / 1024,
-                        "speed_mbps": speed,
-                        "elapsed_seconds": elapsed,
-                        "track_time": track_elapsed,
-                        "total_bytes": total_bytes
-                    })
-            else:
-                failed += 1
-                if progress_callback:
-                    elapsed = time.time() - sync_start_time
-                    progress_callback(current, total, track_name, "Failed", {
-                        "file_size_mb": 0,
-                        "speed_mbps": 0,
-                        "elapsed_seconds": elapsed
-                    })
+            return success, file_size, time.time() - track_start
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(download_one, track): track
+                for track in tracks_to_download
+            }
+
+            for future in as_completed(futures):
+                track = futures[future]
+                success, file_size, track_elapsed = future.result()
+                if success is None:
+                    continue  # Cancelled before this track started
+
+                current += 1
+                with self._lock:
+                    position = _progress_position(current)
+                track_name = f"{track['title']} - {track['artist']}"
+
+                if success:
+                    downloaded += 1
+                    total_bytes += file_size
+                    # add_track appends to the manifest sidecar log, so
+                    # crash recovery no longer needs a full save here;
+                    # one consolidated save runs after the sync loop.
+                    # Locked against the workers' suspect-path remove_track
+                    with self._lock:
+                        self.state.add_track(track, self._cached_fname(track), file_size)
+                    if progress_callback:
+                        elapsed = time.time() - sync_start_time
+                        speed = (total_bytes / 1024 / 1024) / elapsed if elapsed > 0 else 0
+                        progress_callback(position, total, track_name, "Downloaded", {
+                            "file_size_mb": file_size / 1024 / 1024,
+                            "speed_mbps": speed,
+                            "elapsed_seconds": elapsed,
+                            "track_time": track_elapsed,
+                            "total_bytes": total_bytes
+                        })
+                else:
+                    failed += 1
+                    if progress_callback:
+                        elapsed = time.time() - sync_start_time
+                        progress_callback(position, total, track_name, "Failed", {
+                            "file_size_mb": 0,
+                            "speed_mbps": 0,
+                            "elapsed_seconds": elapsed
+                        })
         
         # Delete removed tracks
         for track in tracks_to_delete:
@@ -417,8 +711,77 @@ class SyncEngine:
             "cancelled": self._cancelled
         }
     
+    def _get_spotdl_client(self):
+        """
+        Build or reuse the in-process spotDL client. Returns None when
+        the library isn't importable or construction failed once.
+        """
+        if Spotdl is None:
+            return None
+        if self._spotdl_client is None:
+            try:
+                from spotdl.utils.config import DEFAULT_CONFIG
+
+                output_template = str(
+                    self._output_folder / "{artist} - {title}.{output-ext}"
+                )
+                self._spotdl_client = Spotdl(
+                    client_id=DEFAULT_CONFIG["client_id"],
+                    client_secret=DEFAULT_CONFIG["client_secret"],
+                    downloader_settings={
+                        "output": output_template,
+                        "format": "mp3",
+                        "bitrate": self._bitrate,
+                    },
+                )
+            except Exception as e:
+                print(f"In-process spotDL unavailable ({e}), using subprocess")
+                self._spotdl_client = False
+        return self._spotdl_client or None
+
+    def _download_track_inprocess(
+        self, track: Dict, output_folder: Path
+    ) -> Optional[Tuple[bool, int]]:
+        """
+        Download via the shared in-process client. Returns None when the
+        caller should fall back to the subprocess path.
+        """
+        client = self._get_spotdl_client()
+        if client is None:
+            return None
+
+        query = track.get("url") or f"{track['artist']} - {track['title']}"
+        try:
+            songs = client.search([query])
+            if not songs:
+                print(f"Download failed for '{track.get('title')}': No matching audio found")
+                return False, 0
+            _, path = client.download(songs[0])
+        except Exception as e:
+            print(f"In-process download failed for '{track.get('title')}': {e}")
+            return None
+
+        if path:
+            try:
+                return True, Path(path).stat().st_size
+            except OSError:
+                pass
+
+        expected_file = output_folder / self._cached_fname(track)
+        if expected_file.exists():
+            return True, expected_file.stat().st_size
+        return False, 0
+
     def _download_track(self, track: Dict, output_folder: Path) -> Tuple[bool, int]:
         """Download a single track using spotDL. Returns (success, file_size_bytes)"""
+        # Prefer the in-process client when downloads are serial (the
+        # client shares one event loop, so it isn't safe under the
+        # worker pool); a None result falls through to the subprocess
+        if self._concurrent_downloads <= 1:
+            result = self._download_track_inprocess(track, output_folder)
+            if result is not None:
+                return result
+
         # Build search query - use URL if available, otherwise search by name
         if track.get("url"):
             query = track["url"]
@@ -432,25 +795,25 @@ class SyncEngine:
             self._spotdl_path,
             "--output", output_template,
             "--format", "mp3",
-            "--bitrate", self.config.get("bitrate"),
+            "--bitrate", self._bitrate,
             query
         ]
 
+        process = None
         try:
-            self._current_process = subprocess.Popen(
+            process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True
             )
+            with self._lock:
+                self._processes.add(process)
 
-            timeout = self.config.get("download_timeout")
-            stdout, stderr = self._current_process.communicate(timeout=timeout)
-
-            self._current_process = None
+            stdout, stderr = process.communicate(timeout=self._download_timeout)
 
             # Check if file was created and get size
-            expected_file = output_folder / self._generate_filename(track)
+            expected_file = output_folder / self._cached_fname(track)
 
             # spotDL might use slightly different naming, check for similar files
             if expected_file.exists():
@@ -472,9 +835,8 @@ class SyncEngine:
             return False, 0
 
         except subprocess.TimeoutExpired:
-            if self._current_process:
-                self._current_process.kill()
-                self._current_process = None
+            if process:
+                process.kill()
             print(f"Download timeout for '{track.get('title')}'")
             return False, 0
         except FileNotFoundError:
@@ -489,16 +851,24 @@ class SyncEngine:
         except Exception as e:
             print(f"Unexpected error downloading '{track.get('title')}': {type(e).__name__}: {e}")
             return False, 0
+        finally:
+            if process is not None:
+                with self._lock:
+                    self._processes.discard(process)
     
     def _delete_track(self, track: Dict, output_folder: Path) -> bool:
         """Delete a track file from the output folder"""
-        filename = self._generate_filename(track)
+        filename = self._cached_fname(track)
         filepath = output_folder / filename
         
         try:
-            if filepath.exists():
+            # Unlink directly instead of exists()-then-unlink: one
+            # syscall, and no race if the file vanishes in between
+            try:
                 filepath.unlink()
                 return True
+            except FileNotFoundError:
+                pass
 
             # Try to find by partial match
             pattern = f"*{track['title']}*"
@@ -520,9 +890,9 @@ class SyncEngine:
         """Cancel ongoing sync operation. Thread-safe."""
         with self._lock:
             self._cancelled = True
-            if self._current_process:
+            for process in self._processes:
                 try:
-                    self._current_process.terminate()
+                    process.terminate()
                 except ProcessLookupError:
                     pass  # Process already terminated
                 except OSError as e:
@@ -530,10 +900,21 @@ class SyncEngine:
     
     def _track_key(self, track: Dict) -> str:
         """Generate a unique key for track comparison"""
-        # Normalize for comparison
-        title = track.get("title", "").lower().strip()
-        artist = track.get("artist", "").lower().strip()
+        # Normalize for comparison; casefold matches StateManager's key
+        # normalization so both sides agree on non-ASCII names
+        title = track.get("title", "").casefold().strip()
+        artist = track.get("artist", "").casefold().strip()
         return f"{artist}::{title}"
+
+    def _cached_key(self, track: Dict) -> str:
+        """_track_key memoized on the dict; computed once per track"""
+        return track.get("_key") or track.setdefault("_key", self._track_key(track))
+
+    def _cached_fname(self, track: Dict) -> str:
+        """_generate_filename memoized on the dict"""
+        return track.get("_fname") or track.setdefault(
+            "_fname", self._generate_filename(track)
+        )
     
     def _generate_filename(self, track: Dict) -> str:
         """Generate safe filename for track"""
@@ -542,7 +923,7 @@ class SyncEngine:
 
         # Remove invalid filename characters
         filename = f"{artist} - {title}"
-        filename = re.sub(r'[<>:"/\\|?*]', '', filename)
+        filename = filename.translate(_FILENAME_DELETE)
         filename = filename.replace('..', '')  # Prevent path traversal
         filename = filename.strip('. ')
 
@@ -0,0 +1,77 @@
+"""
+Settings Dialog for Swim Sync
+
+Modal dialog for editing audio bitrate, storage limit and download
+timeout. Lives in its own module so the main app only imports (and
+compiles) it when the user actually opens Settings.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+from swimsync.config_manager import ConfigManager
+
+
+class SettingsDialog:
+    """Settings configuration dialog"""
+
+    def __init__(self, parent, config: ConfigManager, on_save_callback):
+        self.config = config
+        self.on_save = on_save_callback
+
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.title("Settings")
+        self.dialog.geometry("400x300")
+        self.dialog.transient(parent)
+        self.dialog.grab_set()
+
+        self._create_widgets()
+
+    def _create_widgets(self):
+        frame = ttk.Frame(self.dialog, padding="20")
+        frame.pack(fill="both", expand=True)
+
+        row = 0
+
+        # Bitrate
+        ttk.Label(frame, text="Audio Bitrate:").grid(row=row, column=0, sticky="w", pady=5)
+        self.bitrate_var = tk.StringVar(value=self.config.get("bitrate"))
+        bitrate_combo = ttk.Combobox(
+            frame, textvariable=self.bitrate_var,
+            values=["128k", "192k", "256k", "320k"], state="readonly", width=10
+        )
+        bitrate_combo.grid(row=row, column=1, sticky="w", pady=5)
+        row += 1
+
+        # Storage limit
+        ttk.Label(frame, text="Storage Limit (GB):").grid(row=row, column=0, sticky="w", pady=5)
+        self.storage_var = tk.StringVar(value=str(self.config.get("storage_limit_gb")))
+        storage_spin = ttk.Spinbox(
+            frame, from_=1, to=128, textvariable=self.storage_var, width=10
+        )
+        storage_spin.grid(row=row, column=1, sticky="w", pady=5)
+        row += 1
+
+        # Download timeout
+        ttk.Label(frame, text="Download Timeout (sec):").grid(row=row, column=0, sticky="w", pady=5)
+        self.timeout_var = tk.StringVar(value=str(self.config.get("download_timeout")))
+        timeout_spin = ttk.Spinbox(
+            frame, from_=30, to=600, textvariable=self.timeout_var, width=10
+        )
+        timeout_spin.grid(row=row, column=1, sticky="w", pady=5)
+        row += 1
+
+        # Buttons
+        btn_frame = ttk.Frame(frame)
+        btn_frame.grid(row=row, column=0, columnspan=2, pady=20)
+
+        ttk.Button(btn_frame, text="Save", command=self._save).pack(side="left", padx=5)
+        ttk.Button(btn_frame, text="Cancel", command=self.dialog.destroy).pack(side="left", padx=5)
+
+    def _save(self):
+        with self.config.batch():
+            self.config.set("bitrate", self.bitrate_var.get())
+            self.config.set("storage_limit_gb", int(self.storage_var.get()))
+            self.config.set("download_timeout", int(self.timeout_var.get()))
+        self.on_save()
+        self.dialog.destroy()